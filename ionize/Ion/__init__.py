@@ -80,6 +80,14 @@ class Ion(BaseIon):
     # Polynomial function is a derived parameter.
     _nightingale_function = None
 
+    # Derived parameters that are computed once, since ions are immutable.
+    _valence_with_zero = None
+    _sign_valence = None
+    _abs_valence = None
+
+    # Mutable, bounded memo of acidity products, shared by shallow copies.
+    _acidity_product_cache = None
+
     def __init__(self, name, valence, reference_pKa, reference_mobility,
                  reference_temperature=None, enthalpy=None, heat_capacity=None,
                  nightingale_data=None, molecular_weight=None, alias=None):
@@ -128,9 +136,17 @@ class Ion(BaseIon):
             self._nightingale_function = \
                 np.poly1d(self.nightingale_data['fit'])
 
+        self._valence_with_zero = np.sort(np.append(self.valence, [0]))
+        self._valence_with_zero.flags.writeable = False
+        self._sign_valence = np.sign(self.valence).astype(float)
+        self._sign_valence.flags.writeable = False
+        self._abs_valence = np.abs(self.valence).astype(float)
+        self._abs_valence.flags.writeable = False
+        self._acidity_product_cache = {}
+
     def _valence_zero(self):
         """Create a list of charge states with 0 inserted."""
-        return np.sort(np.append(self.valence, [0]))
+        return self._valence_with_zero
 
     from .acidity import pKa, acidity, _clark_glew_pKa, \
         _clark_glew_acidity, _vant_hoff_acidity, _vant_hoff_pKa
@@ -138,6 +154,7 @@ class Ion(BaseIon):
     from .ionization import acidity_product, ionization_fraction, charge
 
     from .mobility import absolute_mobility, actual_mobility, \
-        mobility, robinson_stokes_mobility, onsager_fuoss_mobility
+        mobility, mobility_batch, robinson_stokes_mobility, \
+        onsager_fuoss_mobility
 
     from .transport import molar_conductivity, diffusivity
@@ -1,12 +1,15 @@
 from __future__ import division
 import numpy as np
 
+from ..constants import cache_size
+
 
 def ionization_fraction(self, pH=None, ionic_strength=None, temperature=None):
     """Return the fraction of time the ion is in each valence state.
 
     Value is returned as a numpy array. This array will not sum to 1 due to
-    the fraction of ion in the uncharged state.
+    the fraction of ion in the uncharged state. If pH is an array, the
+    fractions are broadcast along a new last axis.
     """
     pH, ionic_strength, temperature = \
         self._resolve_context(pH, ionic_strength, temperature)
@@ -14,14 +17,16 @@ def ionization_fraction(self, pH=None, ionic_strength=None, temperature=None):
     assert pH is not None, 'Calculation requires a pH.'
 
     # Compute the concentration of H+ from the pH.
-    cH = 10**(-pH)/self._solvent.activity(1, ionic_strength, temperature)
+    cH = (10**(-np.asarray(pH, float)[..., np.newaxis]) /
+          self._solvent.activity(1, ionic_strength, temperature))
 
     # Calculate the numerator of the function for ionization fraction.
     i_frac_vector = (self.acidity_product(ionic_strength, temperature) *
                      cH ** self._valence_zero())
 
     # Filter out the neutral fraction
-    i_frac = i_frac_vector[self._valence_zero() != 0] / i_frac_vector.sum()
+    i_frac = (i_frac_vector[..., self._valence_zero() != 0] /
+              i_frac_vector.sum(-1, keepdims=True))
 
     return i_frac
 
@@ -32,7 +37,7 @@ def charge(self, pH=None, ionic_strength=None, temperature=None, moment=1):
     :param moment: Control which moment average is returned. Default is 1.
     """
     fraction = self.ionization_fraction(pH, ionic_strength, temperature)
-    return np.sum(fraction * self.valence**moment)
+    return np.sum(fraction * self.valence**moment, -1)
 
 
 def acidity_product(self, ionic_strength=None, temperature=None):
@@ -45,6 +50,14 @@ def acidity_product(self, ionic_strength=None, temperature=None):
     _, ionic_strength, temperature = \
         self._resolve_context(None, ionic_strength, temperature)
 
+    # L is reused heavily while a solution equilibrates, so it is cached
+    # for the most recent conditions.
+    key = (ionic_strength, temperature)
+    try:
+        return self._acidity_product_cache[key]
+    except KeyError:
+        pass
+
     Ka = self.acidity(ionic_strength, temperature).tolist()
     index_0 = list(self._valence_zero()).index(0)
     Ka.insert(index_0, 1)
@@ -54,5 +67,9 @@ def acidity_product(self, ionic_strength=None, temperature=None):
     L = np.where(self._valence_zero() >= 0,
                  Lp[self._valence_zero() == 0] / Lp,
                  Lpp / Lpp[self._valence_zero() == 0])
+    L.flags.writeable = False
 
+    if len(self._acidity_product_cache) >= cache_size:
+        self._acidity_product_cache.clear()
+    self._acidity_product_cache[key] = L
     return L
@@ -1,5 +1,6 @@
 from __future__ import division
 from math import copysign, sqrt
+from collections import namedtuple
 import warnings
 import numpy as np
 
@@ -19,11 +20,33 @@ def mobility(self, pH=None, ionic_strength=None, temperature=None):
     pH, ionic_strength, temperature = \
         self._resolve_context(pH, ionic_strength, temperature)
 
-    ionization_fraction = self.ionization_fraction(pH, ionic_strength,
+    assert pH is not None, 'Calculation requires a pH.'
+
+    return self.mobility_batch([pH], ionic_strength, temperature)[0]
+
+
+def mobility_batch(self, pH, ionic_strength=None, temperature=None):
+    """Return the effective mobility of the ion at each of an array of pHs.
+
+    The mobility of each charge state is computed once, and the ionization
+    fraction is broadcast across the pHs, so a pH sweep is a single
+    vectorized calculation.
+
+    :param pH: An array of pH values.
+    :param ionic_strength
+    :param temperature
+    """
+    assert pH is not None, 'Calculation requires a pH.'
+
+    _, ionic_strength, temperature = \
+        self._resolve_context(None, ionic_strength, temperature)
+
+    ionization_fraction = self.ionization_fraction(np.asarray(pH, float),
+                                                   ionic_strength,
                                                    temperature)
     actual_mobility = self.actual_mobility(ionic_strength, temperature)
 
-    effective_mobility = np.sum(ionization_fraction * actual_mobility)
+    effective_mobility = np.sum(ionization_fraction * actual_mobility, -1)
 
     return effective_mobility
 
@@ -84,17 +107,22 @@ def robinson_stokes_mobility(self, ionic_strength=None, temperature=None):
 
     dielectric = self._solvent.dielectric(temperature)
     viscosity = self._solvent.viscosity(temperature)
+    thermal = kelvin(temperature) * dielectric
 
-    alpha = (5.799e5 * abs(self.valence) /
-             (kelvin(temperature) * dielectric)**(3./2.)
-             )
-    beta = (3.022588e-9 * abs(self.valence) / viscosity /
-            (kelvin(temperature) * dielectric)**(1./2.))
+    alpha = 5.799e5 * thermal**(-3./2.)
+    beta = 3.022588e-9 / viscosity / sqrt(thermal)
 
+    root_ionic_strength = sqrt(2 * ionic_strength)
+    factor = root_ionic_strength / (1. + pitts * root_ionic_strength)
+
+    # Scale the correction in place, as (alpha * mobility + beta * sign) *
+    # abs(valence) * factor.
     mobility = self.absolute_mobility(temperature)
-    mobility -= (alpha * mobility +
-                 beta * np.sign(self.valence)) * \
-        (sqrt(2 * ionic_strength) / (1. + pitts * sqrt(2 *ionic_strength)))
+    correction = np.multiply(mobility, alpha)
+    correction += beta * self._sign_valence
+    correction *= self._abs_valence
+    correction *= factor
+    mobility -= correction
 
     return mobility
 
@@ -104,64 +132,185 @@ def onsager_fuoss_mobility(self):
     _, ionic_strength, temperature = \
         self._resolve_context(None, None, None)
 
-    dielectric = self._solvent.dielectric(temperature)
-    viscosity = self._solvent.viscosity(temperature)
+    state = _context_state(self.context())
     interaction = _interaction(self, self.context())
 
-    alpha = (1.98074e6 * abs(self.valence) * interaction /
-             (kelvin(temperature) * dielectric)**(3./2.)
-             )
-    beta = (3.022588e-9 * abs(self.valence) / viscosity /
-            (kelvin(temperature) * dielectric)**(1./2.))
+    root_ionic_strength = sqrt(2 * ionic_strength)
+    factor = root_ionic_strength / (1. + pitts * root_ionic_strength)
 
+    # Scale the correction in place, as (alpha * interaction * mobility +
+    # beta * sign) * abs(valence) * factor.
     mobility = self.absolute_mobility()
-    mobility -= (alpha * mobility +
-                 beta * np.sign(self.valence)) * \
-        (sqrt(2 * ionic_strength) / (1. + pitts * sqrt(2 *ionic_strength)))
+    correction = np.multiply(mobility, interaction)
+    correction *= 1.98074e6 * state.alpha
+    correction += 3.022588e-9 * state.beta * self._sign_valence
+    correction *= self._abs_valence
+    correction *= factor
+    mobility -= correction
 
     return mobility
 
 
+_ContextState = namedtuple('_ContextState',
+                           ['ions', 'alpha', 'beta', 'offsets',
+                            'absolute_mobility', 'valences', 'concentrations',
+                            'interaction'])
+
+
+def _context_state(solution):
+    """Return the properties shared by every ion in a context solution.
+
+    These depend only on the temperature, ionic strength, and pH of the
+    solution, so they are cached for its current state, in caches that the
+    solution empties when it re-equilibrates. The charge state
+    properties of all of the ions are stacked into single arrays, with the
+    states of ion k from offsets[k] to offsets[k+1]. Alpha and beta hold the
+    valence independent parts of the Onsager-Fuoss coefficients.
+    """
+    temperature = solution.temperature()
+    ionic_strength = solution.ionic_strength
+    pH = solution.pH
+
+    key = (temperature, ionic_strength, pH)
+    try:
+        return solution._context_cache[key]
+    except KeyError:
+        pass
+
+    contents = [(ion, concentration)
+                for ion, concentration in solution._contents.items()
+                if concentration > 0]
+    contents += [(solution._hydroxide, solution._cOH()),
+                 (solution._hydronium, solution._cH())]
+    ions = [ion for ion, _ in contents]
+
+    dielectric = solution._solvent.dielectric(temperature)
+    viscosity = solution._solvent.viscosity(temperature)
+
+    # Fill the stacked charge state arrays in one pass over the ions.
+    sizes = np.fromiter((len(ion.valence) for ion in ions), dtype=np.intp,
+                        count=len(ions))
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    valences = np.empty(offsets[-1])
+    concentrations = np.empty(offsets[-1])
+    for k, (ion, concentration) in enumerate(contents):
+        charge_states = slice(offsets[k], offsets[k+1])
+        valences[charge_states] = ion.valence
+        concentrations[charge_states] = \
+            concentration * ion.ionization_fraction(pH, ionic_strength,
+                                                    temperature)
+
+    # The ions of a solution are fixed, so mobilities and omega only change
+    # with temperature, and are cached separately.
+    try:
+        absolute_mobility, omega, inverse_sum = \
+            solution._omega_cache[temperature]
+    except KeyError:
+        absolute_mobility = np.empty(offsets[-1])
+        for k, ion in enumerate(ions):
+            absolute_mobility[offsets[k]:offsets[k+1]] = \
+                ion.absolute_mobility(temperature)
+        omega, inverse_sum = _omega(absolute_mobility, valences)
+
+        solution._omega_cache.clear()
+        solution._omega_cache[temperature] = \
+            absolute_mobility, omega, inverse_sum
+
+    state = _ContextState(
+        ions=ions,
+        alpha=(kelvin(temperature) * dielectric)**(-3./2.),
+        beta=1. / viscosity / (kelvin(temperature) * dielectric)**(1./2.),
+        offsets=offsets,
+        absolute_mobility=absolute_mobility,
+        valences=valences,
+        concentrations=concentrations,
+        interaction=_interaction_factor(omega, inverse_sum, valences,
+                                        concentrations, ionic_strength))
+
+    solution._context_cache.clear()
+    solution._context_cache[key] = state
+    return state
+
+
 def _interaction(ion, solution):
-    ions = [ion_ for ion_ in solution.ions
-            if solution.concentration(ion_) > 0] + \
-           [solution._hydroxide,  solution._hydronium]
-
-    if ion not in ions:
-        ions = ions + [ion]
-    ion_index = ions.index(ion)
-    if ion_index != 0:
-        start_index = len(np.concatenate([ion_.valence
-                                          for ion_ in ions[:ion_index]]))
+    state = _context_state(solution)
+    ions = state.ions
+
+    if ion in ions:
+        ion_index = ions.index(ion)
+        start_index = state.offsets[ion_index]
+        end_index = state.offsets[ion_index + 1]
+        factor = state.interaction
     else:
-        start_index = 0
-    end_index = start_index + len(ion.valence)
+        # The ion is not part of the solution, so it is added as a trace
+        # species on top of the cached solution properties.
+        start_index = state.offsets[-1]
+        end_index = start_index + len(ion.valence)
+        valences = np.concatenate([state.valences, ion.valence])
+        omega, inverse_sum = _omega(
+            np.concatenate([state.absolute_mobility,
+                            ion.absolute_mobility()]),
+            valences)
+        factor = _interaction_factor(
+            omega, inverse_sum, valences,
+            np.concatenate([state.concentrations,
+                            solution.concentration(ion) *
+                            ion.ionization_fraction(solution.pH)]),
+            solution.ionic_strength)
 
-    omega = np.concatenate([ion.absolute_mobility() / ion.valence
-                            for ion in ions]) / faraday
+    return factor[start_index:end_index]
+
+
+def _omega(absolute_mobility, valences):
+    """Return omega for each charge state, and the inverse of their sums.
+
+    The inverse sums, 1 / (omega[i] + omega[j]), form the denominator of the
+    interaction matrix.
+    """
+    omega = absolute_mobility / valences / faraday
 
     if np.any(omega == 0.):
         raise RuntimeError('Onsager-Fuoss approximation '
                            'diverges for non-mobile ions. ')
 
-    valences = np.concatenate([ion.valence for ion in ions])
-    concentrations = np.concatenate([solution.concentration(ion) *
-                                     ion.ionization_fraction(solution.pH)
-                                     for ion in ions])
+    return omega, 1. / (omega + omega[:, np.newaxis])
 
-    potential = concentrations * valences**2. / (2. * solution.ionic_strength)
 
-    h = potential * omega / (omega + omega[:, np.newaxis])
-    d = np.diag(np.sum(h, 1))
-    B = 2 * (h + d) - np.identity(len(omega))
+def _interaction_factor(omega, inverse_sum, valences, concentrations,
+                        ionic_strength):
+    """Return the Onsager-Fuoss interaction factor of each charge state."""
+    potential = concentrations * valences**2. / (2. * ionic_strength)
 
-    r = np.zeros([len(omega), 6])
-    r[:, 0] = (valences - (np.sum(valences * potential) /
-                           np.sum(potential / omega)) / omega)
+    return _onsager_fuoss_kernel(omega, inverse_sum, potential, valences)
 
-    for i in range(1, 6):
-        r[:, i] = np.dot(B, r[:, i-1])
 
-    factor = np.dot(onsager_fuoss, np.transpose(r))
+def _onsager_fuoss_kernel(omega, inverse_sum, potential, valences):
+    """Return the Onsager-Fuoss interaction factor for a set of charge states.
 
-    return factor[start_index:end_index]
+    :param omega: The mobility of each charge state, divided by its valence
+        and the Faraday constant.
+    :param inverse_sum: The matrix of 1 / (omega[i] + omega[j]).
+    :param potential: The fraction of the ionic strength due to each charge
+        state.
+    :param valences: The valence of each charge state.
+
+    The factor is the series of onsager_fuoss[k] * B**k * r_0 in the
+    interaction matrix B. It is evaluated by Horner's rule, so B is only
+    ever applied to a vector, and the intermediate r vectors are not stored.
+    """
+    # B = 2 * (h + diag(sum(h, 1))) - identity, built in place on h.
+    B = np.multiply(potential * omega, inverse_sum)
+    row_sums = B.sum(1)
+    B *= 2.
+    diagonal = np.arange(len(omega))
+    B[diagonal, diagonal] += 2. * row_sums - 1.
+
+    r = (valences - (np.sum(valences * potential) /
+                     np.sum(potential / omega)) / omega)
+
+    factor = onsager_fuoss[-1] * r
+    for coefficient in onsager_fuoss[-2::-1]:
+        factor = np.dot(B, factor)
+        factor += coefficient * r
+
+    return factor
@@ -54,6 +54,17 @@ class Solution(object):
     _state = ('ions', 'concentrations')
     _contents = OrderedDict()
 
+    # Properties shared by ions that use the Solution as their context,
+    # cached for the current temperature, ionic strength, and pH. Properties
+    # that only depend on temperature are cached separately. Both caches are
+    # filled by ionize.Ion.mobility, and emptied by _clear_caches.
+    _context_cache = None
+    _omega_cache = None
+
+    # The equilibrium pH polynomial, cached by ionic strength and temperature.
+    # Filled by the equilibrium module, and emptied by _clear_caches.
+    _polynomial_cache = None
+
     @property
     def _name_lookup(self):
         name_lookup = dict()
@@ -105,6 +116,9 @@ class Solution(object):
             'There must be an ion for each concentration.'
 
         self._contents = OrderedDict()
+        self._context_cache = dict()
+        self._omega_cache = dict()
+        self._polynomial_cache = dict()
         for ion, concentration in zip(ions, concentrations):
             if isinstance(ion, str):
                 ion = database.load(ion)
@@ -151,6 +165,15 @@ class Solution(object):
 
             return manage_temperature()
 
+    def _clear_caches(self):
+        """Empty the caches of properties derived from the solution state.
+
+        This must be called whenever the contents or temperature change.
+        """
+        self._polynomial_cache.clear()
+        self._context_cache.clear()
+        self._omega_cache.clear()
+
     def _cH(self):
         """Return the concentration of protons in solution."""
         cH = 10**(-self.pH)/self._solvent.activity(1, self.ionic_strength,
@@ -1,9 +1,11 @@
 from __future__ import division
 import numpy as np
-from math import log10, sqrt
+from math import log, log10, sqrt
 from scipy.optimize import newton, brentq
 import warnings
 
+from ..constants import cache_size
+
 
 def _calculate_ionic_strength(self, pH, guess):
     # For each ion, add the contribution to ionic strength to the sum.
@@ -19,73 +21,179 @@ def _calculate_ionic_strength(self, pH, guess):
     return I
 
 
-def _calculate_pH(self, ionic_strength):
-    # Find the order of the polynomial. This is the maximum
-    # size of the list of charge states in an ion.
-    ions = [ion for ion in self.ions if hasattr(ion, 'valence')]
-    max_columns = max([max(ion.valence)-min(ion.valence)+2
-                       for ion in ions])
-    n_ions = len(ions)
-
-    # Set up the matrix of Ls, the multiplication
-    # of acidity coefficients for each ion.
-    l_matrix = np.array([np.resize(ion.acidity_product(ionic_strength),
-                        [max_columns])
-                        for ion in ions])
-    concentrations = np.array([self.concentration(ion) for ion in ions])
-
-    # Construct Q vector.
-    Q = 1.0
-    for j in range(n_ions):
-        Q = np.convolve(Q, l_matrix[j, :])
-
-    # Convolve with water dissociation.
-    Q = np.convolve(Q, [-self._solvent.dissociation(ionic_strength,
-                                                    self.temperature()),
-                        0.0, 1.0])
+def _leave_one_out_products(rows):
+    """Return the product of polynomial rows, and the products without each.
+
+    The products that leave out one row are built from prefix and suffix
+    products, so the number of convolutions grows linearly with the number
+    of rows, and no polynomial division is needed.
+    """
+    prefix = [np.ones(1)]
+    for row in rows[:-1]:
+        prefix.append(np.convolve(prefix[-1], row))
+
+    suffix = [np.ones(1)]
+    for row in rows[:0:-1]:
+        suffix.append(np.convolve(suffix[-1], row))
+    suffix.reverse()
+
+    product = np.convolve(prefix[-1], rows[-1])
+    others = [np.convolve(before, after)
+              for before, after in zip(prefix, suffix)]
+    return product, others
+
+
+def _horner(coefficients, x):
+    """Evaluate a polynomial and its first two derivatives at x.
+
+    coefficients are ordered highest degree first, as Python floats. All
+    three values are accumulated in a single pass of Horner's rule.
+    """
+    f = first = half_second = 0.
+    for coefficient in coefficients:
+        half_second = half_second * x + first
+        first = first * x + f
+        f = f * x + coefficient
+    return f, first, 2. * half_second
+
+
+def _find_root(poly, guess, tolerance=1e-12, max_iterations=50):
+    """Return the positive root of poly using a safeguarded Halley's method.
+
+    poly is ordered highest degree first, as for numpy.roots, and should have
+    a single positive root. The iteration starts from guess and keeps the
+    root bracketed by the sign of the polynomial. A Halley step is only
+    taken if it stays in the bracket and is at most half the length, in
+    log(x), of the previous step, since far from the root, where a high
+    power of x dominates, Halley only crawls by a fixed ratio per step.
+    Otherwise the step is a geometric bisection of the bracket, or a decade
+    towards the root while the bracket is open. Returns None if it fails to
+    converge.
+    """
+    # Leading zeros would hide the sign of the polynomial above the root.
+    poly = np.trim_zeros(poly, 'f')
+    coefficients = poly.tolist()
+    positive_above = coefficients[0] > 0
+
+    lower, upper = 0., float('inf')
+    last_step = float('inf')
+    x = guess
+    for _ in range(max_iterations):
+        f, fp, fpp = _horner(coefficients, x)
+        if f == 0.:
+            return x
+        elif (f > 0.) == positive_above:
+            upper = x
+        else:
+            lower = x
+
+        denominator = 2. * fp * fp - f * fpp
+        if denominator != 0.:
+            x_new = x - 2. * f * fp / denominator
+            # Near the root, round-off can push a converged step just out
+            # of the bracket, so convergence is checked first.
+            if abs(x_new - x) < tolerance * x:
+                return x_new
+        if (denominator == 0. or not lower < x_new < upper or
+                abs(log(x_new / x)) > last_step / 2.):
+            if upper == float('inf'):
+                x_new = 10. * x
+            elif lower == 0.:
+                x_new = x / 10.
+            else:
+                x_new = sqrt(lower * upper)
+
+        if abs(x_new - x) < tolerance * x_new:
+            return x_new
+        last_step = abs(log(x_new / x))
+        x = x_new
+    return None
+
+
+def _pH_polynomial(self, ionic_strength, temperature):
+    """Return the polynomial in cH whose positive root is the equilibrium.
+
+    The coefficients are ordered highest degree first. The ions and their
+    concentrations are fixed for a solution, so the polynomial only depends
+    on ionic strength and temperature. It is cached, because brentq and the
+    bounds in _equilibrate revisit the same ionic strengths.
+    """
+    key = (ionic_strength, temperature)
+    try:
+        return self._polynomial_cache[key]
+    except KeyError:
+        pass
+
+    # Read concentrations directly, since looking up ions hashes them.
+    contents = [(ion, concentration)
+                for ion, concentration in self._contents.items()
+                if hasattr(ion, 'valence')]
+    ions = [ion for ion, _ in contents]
+    concentrations = np.array([concentration for _, concentration in contents])
+
+    # The L of each ion, the multiplication of its acidity coefficients, is
+    # kept at its own length so that no padding is carried through the
+    # products, along with the matching charge states.
+    l_rows = [ion.acidity_product(ionic_strength, temperature)
+              for ion in ions]
+    z_rows = [ion._valence_zero() for ion in ions]
+
+    # Each row of P replaces the L of one ion by its charge-weighted L.
+    ion_product, others = _leave_one_out_products(l_rows)
+
+    # Multiply by the water dissociation polynomial, x**2 - Kw.
+    Q = np.zeros(len(ion_product) + 2)
+    Q[:-2] = -self._solvent.dissociation(ionic_strength,
+                                         temperature) * ion_product
+    Q[2:] += ion_product
 
     # Construct P matrix
-    PMat = []
-    for i, ion in enumerate(ions):
-        z_list = np.resize(ion._valence_zero(), [max_columns])
-
-        Mmod = l_matrix.copy()
-        Mmod[i, :] *= np.array(z_list)
-
-        Pi = 1.
-        for kl in range(n_ions):
-            Pi = np.convolve(Pi, Mmod[kl, :])
-
-        Pi = np.convolve([0.0, 1.0], Pi)  # Convolve with P2
-        PMat.append(Pi)
-
-    # Multiply P matrix by concentrations, and sum.
-    P = np.sum(np.array(PMat, ndmin=2) *
-               np.array(concentrations)[:, np.newaxis], 0)
-    # Construct polynomial. Change the shapes as needed, then reverse the order
-    if len(P) < len(Q):
-        P = np.resize(P, Q.shape)
-    elif len(P) > len(Q):
-        Q = np.resize(Q, P.shape)
-    poly = (P+Q)[::-1]
-
-    # Solve Polynomial for concentration
-
-    cH = np.roots(poly)
-
-    # Parse the real roots of the root finding algorithms
-    cH = [c for c in cH if c.real > 0 and c.imag == 0]
-    if len(cH) == 1:
-        cH = np.real(cH)[0]
-    elif len(cH) > 1:
-        warnings.warn('Found multiple possible pH solutions. Choosing one.')
-        cH = np.real(cH)[0]
-    else:
-        raise RuntimeError('Failed to find pH.')
+    PMat = [np.convolve(other, l_row * z_row)
+            for other, l_row, z_row in zip(others, l_rows, z_rows)]
+
+    # Multiply P matrix by concentrations, and sum. Then multiply by P2, x,
+    # by shifting the coefficients up one degree.
+    P = np.zeros(len(PMat[0]) + 1)
+    P[1:] = np.dot(concentrations, PMat)
+
+    # Construct polynomial. Zero pad the shorter of P and Q, then reverse
+    # the order.
+    poly = np.zeros(max(len(P), len(Q)))
+    poly[:len(P)] += P
+    poly[:len(Q)] += Q
+    poly = poly[::-1]
+
+    if len(self._polynomial_cache) >= cache_size:
+        self._polynomial_cache.clear()
+    self._polynomial_cache[key] = poly
+    return poly
+
+
+def _calculate_pH(self, ionic_strength):
+    temperature = self.temperature()
+    poly = _pH_polynomial(self, ionic_strength, temperature)
+
+    # Solve Polynomial for concentration. Start from the current pH, and
+    # only fall back on the full set of roots if the iteration fails.
+    cH = _find_root(poly, 10**(-self._pH))
+
+    if cH is None:
+        cH = np.roots(poly)
+
+        # Parse the real roots of the root finding algorithms
+        cH = [c for c in cH if c.real > 0 and c.imag == 0]
+        if len(cH) == 1:
+            cH = np.real(cH)[0]
+        elif len(cH) > 1:
+            warnings.warn('Found multiple possible pH solutions. '
+                          'Choosing one.')
+            cH = np.real(cH)[0]
+        else:
+            raise RuntimeError('Failed to find pH.')
 
     # Convert to pH. Use the activity to correct the calculation.
     pH = -log10(cH * self._solvent.activity(1, ionic_strength,
-                                            self.temperature()))
+                                            temperature))
     return pH
 
 
@@ -111,6 +219,9 @@ def _equilibrate(self):
     adjusted activity coefficients. This function is called when the selfect is
     initialized.
     """
+    # The contents or temperature may have changed since the last call.
+    self._clear_caches()
+
     if not [ion for ion in self.ions if hasattr(ion, 'valence')]:
         dissociation = self._solvent.dissociation(0, self.temperature())
         self._pH = -log10(sqrt(dissociation))
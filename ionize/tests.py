@@ -5,11 +5,13 @@ from .Ion import Ion
 from .PolyIon import NucleicAcid, Peptide
 from .IonComplex import Protein
 from .Solution import Solution
+from .Solution import equilibrium
 from .Database import Database
 from .deserialize import deserialize
 from .__main__ import cli
 
 import unittest
+from unittest import mock
 import warnings
 import numpy as np
 from copy import copy
@@ -43,6 +45,13 @@ class TestAqueous(unittest.TestCase):
             self.assertLess(v_new, v)
             v = v_new
 
+    def test_array_temperatures(self):
+        """Test that properties accept arrays of temperatures."""
+        for prop in (self.aqueous.dielectric, self.aqueous.viscosity):
+            values = prop(self.temperature_range)
+            self.assertEqual(values.shape, self.temperature_range.shape)
+            self.assertEqual(values[0], prop(self.temperature_range[0]))
+
     def test_dissociation(self):
         """Test that dissociation constant is monotone increasing."""
         k = 0
@@ -169,6 +178,25 @@ class TestIon(unittest.TestCase):
                         ion.mobility(pH, I, T)
                         ion.diffusivity(pH, I, T)
 
+    def test_mobility_requires_pH(self):
+        ion = self.database.load('tris')
+        with self.assertRaises(AssertionError):
+            ion.mobility()
+        with self.assertRaises(AssertionError):
+            ion.mobility_batch(None)
+
+    def test_mobility_batch(self):
+        pH_list = np.linspace(2, 12, 6)
+        for ion_name in ('tris', 'citric acid', 'histidine'):
+            ion = self.database.load(ion_name)
+            mobility = ion.mobility_batch(pH_list, .01, 25.)
+            self.assertEqual(mobility.shape, pH_list.shape)
+            actual_mobility = ion.actual_mobility(.01, 25.)
+            for pH, batch in zip(pH_list, mobility):
+                expected = np.sum(ion.ionization_fraction(pH, .01, 25.) *
+                                  actual_mobility)
+                self.assertAlmostEqual(expected / batch, 1.)
+
     def test_equality(self):
         hcl = self.database.load('hydrochloric acid')
         hcl2 = self.database.load('hydrochloric acid')
@@ -360,6 +388,42 @@ class TestSolution(unittest.TestCase):
         sol = Solution().equilibrate_CO2()
         self.assertAlmostEqual(sol.pH, 5.6, 1)
 
+    def test_basic_equilibrium(self):
+        """Test that strongly basic solutions converge quickly from pH 7."""
+        for ions in (['tris', 'potassium', 'calcium'],
+                     ['bis-tris', 'magnesium', 'calcium'],
+                     ['glycine', 'lysine', 'magnesium']):
+            with mock.patch('numpy.roots', side_effect=AssertionError):
+                sol = Solution(ions, [0.1, 0.1, 0.1])
+            self.assertGreater(sol.pH, 11)
+            poly = equilibrium._pH_polynomial(sol, sol.ionic_strength,
+                                              sol.temperature())
+            cH = equilibrium._find_root(poly, 1e-7, max_iterations=20)
+            self.assertIsNotNone(cH)
+            self.assertAlmostEqual(np.polyval(poly, cH) /
+                                   np.polyval(np.abs(poly), cH), 0)
+
+    def test_charge_balance(self):
+        """Test charge balance in mixtures spanning several charge states."""
+        for ions, pH in ((['hepes', 'acetic acid', 'glycine', 'calcium'],
+                          8.57),
+                         (['phosphoric acid', 'magnesium'], 9.19)):
+            sol = Solution(ions, [0.01] * len(ions))
+            self.assertAlmostEqual(sol.pH, pH, 2)
+            cH = sol.concentration('H+')
+            cOH = sol._solvent.dissociation(sol.ionic_strength,
+                                            sol.temperature()) / cH
+            net = sum(sol.concentration(ion) * ion.charge()
+                      for ion in sol.ions)
+            self.assertAlmostEqual((net + cH - cOH) / cOH, 0, 9)
+
+    def test_roots_fallback(self):
+        """Test that np.roots agrees with the iteration when it fails."""
+        sol = Solution(['tris', 'acetic acid'], [0.01, 0.005])
+        with mock.patch.object(equilibrium, '_find_root', return_value=None):
+            fallback = Solution(['tris', 'acetic acid'], [0.01, 0.005])
+        self.assertAlmostEqual(sol.pH, fallback.pH)
+
     def test_displace(self):
         sol = Solution(['tris', 'acetic acid'], [0.01, 0.005])
         cycle = sol.displace('tris', 'bis-tris').displace('bis-tris', 'tris')
@@ -369,6 +433,13 @@ class TestSolution(unittest.TestCase):
         sol = Solution(['tris', 'chloride', 'hepes'], [0.01, 0.004, 0.001])
         cycle = sol.displace('chloride', guess=[0.009, 0.004])
         self.assertAlmostEqual(sol.pH, cycle.pH, 0)
+        # Cached properties of the original solution must not leak into
+        # the displaced solution.
+        sol = Solution(['tris', 'acetic acid'], [0.01, 0.005])
+        sol.conductivity()
+        displaced = sol.displace('acetic acid', 'citric acid')
+        fresh = Solution(displaced.ions, displaced.concentrations)
+        self.assertAlmostEqual(displaced.conductivity(), fresh.conductivity())
 
     def test_safe(self):
         """Test safe pH evaluation."""